@@ -6,12 +6,49 @@ from typing import List, Tuple, Dict
 
 import pygame
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain Python
+    njit = None
+
+
+def _bird_step(dt: float, gravity: float, rotation_speed: float,
+               velocity_y: float, position_y: float, rotation: float,
+               max_fall_speed: float) -> Tuple[float, float, float]:
+    """Scalar physics step for a flying bird; kept module-level so it can be JITed."""
+    velocity_y = velocity_y + gravity * dt
+    if velocity_y > max_fall_speed:
+        velocity_y = max_fall_speed
+    position_y = position_y + velocity_y * dt
+    # Smoother rotation based on velocity - reduced to keep beak stable
+    target_rotation = min(5.0, max(-10.0, -velocity_y * 0.5))
+    rotation = rotation + (target_rotation - rotation) * min(1.0, rotation_speed * dt)
+    return velocity_y, position_y, rotation
+
+
+if njit is not None:
+    _bird_step = njit(cache=True)(_bird_step)
+    _bird_step(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)  # warm up the compile at import
+
 
 def get_resource_path(*parts: str) -> str:
     base_dir = os.path.dirname(os.path.abspath(__file__))
     return os.path.join(base_dir, *parts)
 
 
+# Bird rotation is quantized to 5-degree buckets so rotated frames can be
+# precomputed once instead of resampled every frame. The physics clamps the
+# target rotation to [-10, +5] degrees, so only those buckets can occur.
+ROTATION_STEP = 5
+ROTATION_MIN_BUCKET = -2  # -10 degrees
+ROTATION_MAX_BUCKET = 1   # +5 degrees
+
+# 256-sample sine table for the idle wobble; close enough for a 3px bob
+# and avoids a libm call per frame
+_SIN_LUT = tuple(math.sin(2 * math.pi * i / 256) for i in range(256))
+_SIN_SCALE = 256 / (2 * math.pi)
+
+
 class SpriteLibrary:
     def __init__(self, screen_scale: float = 1.0) -> None:
         self.scale = screen_scale
@@ -19,9 +56,11 @@ class SpriteLibrary:
         self.base: pygame.Surface
         self.birds: Dict[str, List[pygame.Surface]] = {}
         self.pipes: Dict[str, pygame.Surface] = {}
+        self.pipes_flipped: Dict[str, pygame.Surface] = {}
         self.message: pygame.Surface
         self.gameover: pygame.Surface
         self.digits: List[pygame.Surface] = []
+        self.digit_widths: Tuple[int, ...] = ()
         self._load_all()
 
     def _load_image(self, *path: str, convert_alpha: bool = True) -> pygame.Surface:
@@ -31,18 +70,22 @@ class SpriteLibrary:
             return image.convert_alpha() if convert_alpha else image.convert()
         return image
 
-    def _scale_surface(self, surface: pygame.Surface) -> pygame.Surface:
-        if self.scale == 1.0:
+    def _scale_surface(self, surface: pygame.Surface, use_smooth: bool = False) -> pygame.Surface:
+        if abs(self.scale - 1.0) < 1e-6:
             return surface
         width = int(surface.get_width() * self.scale)
         height = int(surface.get_height() * self.scale)
-        return pygame.transform.smoothscale(surface, (width, height))
+        # Nearest-neighbour keeps pixel art crisp and is several times
+        # faster; smoothscale is only worth it for the backgrounds
+        if use_smooth:
+            return pygame.transform.smoothscale(surface, (width, height))
+        return pygame.transform.scale(surface, (width, height))
 
     def _load_all(self) -> None:
-        self.backgrounds["day"] = self._scale_surface(self._load_image("sprites", "background-day.png"))
-        self.backgrounds["night"] = self._scale_surface(self._load_image("sprites", "background-night.png"))
+        self.backgrounds["day"] = self._scale_surface(self._load_image("sprites", "background-day.png"), use_smooth=True)
+        self.backgrounds["night"] = self._scale_surface(self._load_image("sprites", "background-night.png"), use_smooth=True)
 
-        self.base = self._scale_surface(self._load_image("sprites", "base.png"))
+        self.base = self._scale_surface(self._load_image("sprites", "base.png"), use_smooth=True)
 
         bird_sets = {
             "yellow": [
@@ -67,12 +110,16 @@ class SpriteLibrary:
 
         self.pipes["green"] = self._scale_surface(self._load_image("sprites", "pipe-green.png"))
         self.pipes["red"] = self._scale_surface(self._load_image("sprites", "pipe-red.png"))
+        # Flip once here so spawning a pipe never has to transform a surface
+        for color, image in self.pipes.items():
+            self.pipes_flipped[color] = pygame.transform.flip(image, False, True)
 
         self.message = self._scale_surface(self._load_image("sprites", "message.png"))
         self.gameover = self._scale_surface(self._load_image("sprites", "gameover.png"))
 
         for i in range(10):
             self.digits.append(self._scale_surface(self._load_image("sprites", f"{i}.png")))
+        self.digit_widths = tuple(d.get_width() for d in self.digits)
 
 
 class SoundLibrary:
@@ -117,6 +164,7 @@ class Bird:
     def __init__(self, frames: List[pygame.Surface], start_pos: Tuple[int, int]) -> None:
         self.frames = frames
         self.animation_index = 0
+        self.current_frame = frames[0]  # refreshed by update()
         self.animation_timer = 0.0
         self.animation_interval = 0.08  # Faster animation for smoother look
         self.position_x, self.position_y = start_pos
@@ -126,18 +174,27 @@ class Bird:
         self.max_fall_speed = 400.0  # Cap falling speed
         self.wobble_amplitude = 3.0  # Subtle up-down motion when idle
         self.wobble_timer = 0.0
-
-    @property
-    def image(self) -> pygame.Surface:
-        return self.frames[int(self.animation_index) % len(self.frames)]
+        # Precompute every rotation bucket for every frame so draw() never
+        # calls pygame.transform.rotate on the hot path
+        # Reusable hitbox, updated in place each tick (8px smaller than the
+        # sprite for more forgiving collisions)
+        self._frame_w = frames[0].get_width()
+        self._frame_h = frames[0].get_height()
+        self._rect = pygame.Rect(int(self.position_x) + 4, int(self.position_y) + 4,
+                                 self._frame_w - 8, self._frame_h - 8)
+        self.rotated_frames: List[List[pygame.Surface]] = []
+        has_display = pygame.display.get_surface() is not None
+        for frame in frames:
+            buckets = []
+            for bucket in range(ROTATION_MIN_BUCKET, ROTATION_MAX_BUCKET + 1):
+                rotated = pygame.transform.rotate(frame, bucket * ROTATION_STEP)
+                if has_display:
+                    rotated = rotated.convert_alpha()
+                buckets.append(rotated)
+            self.rotated_frames.append(buckets)
 
     def rect(self) -> pygame.Rect:
-        img = self.image
-        # Smaller hitbox for more forgiving collisions
-        rect = pygame.Rect(int(self.position_x), int(self.position_y), img.get_width(), img.get_height())
-        # Shrink hitbox slightly
-        rect.inflate_ip(-8, -8)
-        return rect
+        return self._rect
 
     def update(self, dt: float, gravity: float, rotation_speed: float, is_playing: bool = True) -> None:
         if self.dead:
@@ -147,87 +204,106 @@ class Bird:
             if self.animation_timer >= self.animation_interval:
                 self.animation_timer = 0.0
                 self.animation_index = (self.animation_index + 1) % len(self.frames)
+        self.current_frame = self.frames[self.animation_index]
 
         if is_playing:
-            # Apply gravity with terminal velocity
-            self.velocity_y += gravity * dt
-            self.velocity_y = min(self.velocity_y, self.max_fall_speed)
-            self.position_y += self.velocity_y * dt
-            
-            # Smoother rotation based on velocity - reduced to keep beak stable
-            target_rotation = min(5, max(-10, -self.velocity_y * 0.5))  # Much less rotation
-            self.rotation += (target_rotation - self.rotation) * min(1.0, rotation_speed * dt)
+            self.velocity_y, self.position_y, self.rotation = _bird_step(
+                dt, gravity, rotation_speed,
+                self.velocity_y, self.position_y, self.rotation, self.max_fall_speed)
         else:
             # Idle wobble animation
             self.wobble_timer += dt
-            wobble_offset = self.wobble_amplitude * math.sin(self.wobble_timer * 3)
+            wobble_offset = self.wobble_amplitude * _SIN_LUT[int(self.wobble_timer * 3 * _SIN_SCALE) & 255]
             self.position_y += wobble_offset * dt * 20
             self.rotation = 0
 
+        self._rect.x = int(self.position_x) + 4
+        self._rect.y = int(self.position_y) + 4
+
     def flap(self, impulse: float) -> None:
         if not self.dead:
             self.velocity_y = -impulse
 
-    def draw(self, surface: pygame.Surface) -> None:
-        rotated = pygame.transform.rotate(self.image, self.rotation)
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
+        if abs(self.rotation) < 1.0:
+            # Near-zero rotation (all of WELCOME, much of cruising): blit
+            # the unrotated frame directly
+            pos = (int(self.position_x), int(self.position_y))
+            surface.blit(self.current_frame, pos)
+            return pygame.Rect(pos, (self._frame_w, self._frame_h))
+        bucket = max(ROTATION_MIN_BUCKET, min(ROTATION_MAX_BUCKET, int(round(self.rotation / ROTATION_STEP))))
+        rotated = self.rotated_frames[self.animation_index][bucket - ROTATION_MIN_BUCKET]
         # Use actual rect center for proper rotation
-        actual_rect = pygame.Rect(int(self.position_x), int(self.position_y), 
-                                  self.image.get_width(), self.image.get_height())
+        actual_rect = pygame.Rect(int(self.position_x), int(self.position_y),
+                                  self._frame_w, self._frame_h)
         rect = rotated.get_rect(center=actual_rect.center)
         surface.blit(rotated, rect.topleft)
+        return rect
 
 
 class PipePair:
-    def __init__(self, pipe_image: pygame.Surface, x: int, gap_y: int, gap_size: int, bottom_y: int) -> None:
+    def __init__(self, pipe_image: pygame.Surface, pipe_image_flipped: pygame.Surface,
+                 x: int, gap_y: int, gap_size: int, bottom_y: int) -> None:
         self.pipe_image = pipe_image
-        self.pipe_image_flipped = pygame.transform.flip(pipe_image, False, True)
+        self.pipe_image_flipped = pipe_image_flipped
         self.x = float(x)
         self.gap_y = gap_y
         self.gap_size = gap_size
         self.bottom_y = bottom_y
         self.speed = 200.0  # Faster for better flow
         self.passed = False
+        # Geometry only depends on x after construction, so cache everything else
+        self._w = pipe_image.get_width()
+        self._h = pipe_image.get_height()
+        self._top_y = self.gap_y - self.gap_size // 2 - self._h
+        self._bot_y = self.gap_y + self.gap_size // 2
+        self._rebuild_rects()
+
+    def _rebuild_rects(self) -> None:
+        top_rect = pygame.Rect(int(self.x), self._top_y, self._w, self._h)
+        bottom_rect = pygame.Rect(int(self.x), self._bot_y, self._w, self._h)
+        # Shrink pipe hitboxes slightly for more forgiving gameplay
+        top_rect.inflate_ip(-4, 0)
+        bottom_rect.inflate_ip(-4, 0)
+        self._top_rect = top_rect
+        self._bottom_rect = bottom_rect
 
     @property
     def width(self) -> int:
-        return self.pipe_image.get_width()
+        return self._w
 
     def rects(self) -> Tuple[pygame.Rect, pygame.Rect]:
-        top_height = self.gap_y - self.gap_size // 2
-        bottom_top = self.gap_y + self.gap_size // 2
-        top_rect = pygame.Rect(int(self.x), int(top_height) - self.pipe_image.get_height(), 
-                                self.width, self.pipe_image.get_height())
-        bottom_rect = pygame.Rect(int(self.x), int(bottom_top), self.width, self.pipe_image.get_height())
-        # Shrink pipe hitboxes slightly for more forgiving gameplay
-        top_rect.inflate_ip(-4, 0)
-        bottom_rect.inflate_ip(-4, 0)
-        return top_rect, bottom_rect
+        return self._top_rect, self._bottom_rect
 
     def update(self, dt: float) -> None:
         self.x -= self.speed * dt
+        self._rebuild_rects()
 
     def draw(self, surface: pygame.Surface) -> None:
-        top_rect, bottom_rect = self.rects()
-        # Adjust drawing position to account for shrunken hitbox
-        draw_top = pygame.Rect(int(self.x) - 2, top_rect.top, self.width, top_rect.height)
-        draw_bottom = pygame.Rect(int(self.x) - 2, bottom_rect.top, self.width, bottom_rect.height)
-        surface.blit(self.pipe_image_flipped, draw_top.topleft)
-        surface.blit(self.pipe_image, draw_bottom.topleft)
+        # Offset by -2 to account for the shrunken hitbox; blit takes a
+        # plain (x, y) tuple so no Rects are needed here
+        x = int(self.x) - 2
+        surface.blit(self.pipe_image_flipped, (x, self._top_y))
+        surface.blit(self.pipe_image, (x, self._bot_y))
 
 
 class Game:
     def __init__(self) -> None:
         pygame.init()
 
+        # Open the display before loading sprites so _load_image can
+        # convert every surface to the display format; unconverted
+        # surfaces pay a per-blit conversion cost forever after.
+        probe = pygame.image.load(get_resource_path("sprites", "background-day.png"))
+        self.screen_width, self.screen_height = probe.get_size()
+        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
+        pygame.display.set_caption("Flappy Bird")
+
         self.sprites = SpriteLibrary()
         self.sounds = SoundLibrary()
 
         self.background_key = random.choice(["day", "night"])
         self.background = self.sprites.backgrounds[self.background_key]
-        self.screen_width = self.background.get_width()
-        self.screen_height = self.background.get_height()
-        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
-        pygame.display.set_caption("Flappy Bird")
 
         self.clock = pygame.time.Clock()
         self.fps = 60
@@ -236,12 +312,16 @@ class Game:
         self.base_y = self.screen_height - self.base.get_height()
         self.base_x = 0.0
         self.base_speed = 200.0  # Faster base movement
+        # Pre-tile the base once; scrolling then needs one source-rect blit
+        self.base_strip = pygame.Surface((self.base.get_width() + self.screen_width,
+                                          self.base.get_height())).convert()
+        self.base_strip.blit(self.base, (0, 0))
+        self.base_strip.blit(self.base, (self.base.get_width(), 0))
 
         # Choose pipe color based on background - green for day, red for night
-        if self.background_key == "day":
-            self.pipe_image = self.sprites.pipes["green"]
-        else:
-            self.pipe_image = self.sprites.pipes["red"]
+        pipe_color = "green" if self.background_key == "day" else "red"
+        self.pipe_image = self.sprites.pipes[pipe_color]
+        self.pipe_image_flipped = self.sprites.pipes_flipped[pipe_color]
         self.pipes: List[PipePair] = []
         self.pipe_spawn_timer = 0.0
         self.pipe_spawn_interval = 1.5  # Less space between pipes for faster gameplay
@@ -256,9 +336,18 @@ class Game:
         self.state = "WELCOME"
         self.score = 0
         self.high_score = self._load_high_score()
-        
+        self._high_score_dirty = False  # new high score not yet on disk
+        # Composited digit strips keyed by value, so a score is blitted once
+        self._score_cache: Dict[int, pygame.Surface] = {}
+
         # Pipe gap settings
         self.base_pipe_gap = 140  # Keep gap constant throughout the game
+        # Static portion of the spawn bounds; only the gap term varies
+        self._spawn_min_center_base = int(self.screen_height * 0.25)
+        self._spawn_max_center_base = int(self.base_y - 20)
+
+        # Dirty rects pushed to the display last frame (see run)
+        self._prev_dirty: List[pygame.Rect] = []
 
     def _load_high_score(self) -> int:
         """Load high score from file if it exists."""
@@ -269,22 +358,23 @@ class Game:
             return 0
 
     def _save_high_score(self) -> None:
-        """Save high score to file."""
+        """Save high score to file (write-and-rename to avoid corruption)."""
         try:
-            with open("highscore.txt", "w") as f:
+            with open("highscore.txt.tmp", "w") as f:
                 f.write(str(self.high_score))
+            os.replace("highscore.txt.tmp", "highscore.txt")
         except:
             pass
+        self._high_score_dirty = False
 
     def reset(self) -> None:
         self.background_key = "night" if self.background_key == "day" else "day"
         self.background = self.sprites.backgrounds[self.background_key]
         self.base_x = 0.0
         # Choose pipe color based on background - green for day, red for night
-        if self.background_key == "day":
-            self.pipe_image = self.sprites.pipes["green"]
-        else:
-            self.pipe_image = self.sprites.pipes["red"]
+        pipe_color = "green" if self.background_key == "day" else "red"
+        self.pipe_image = self.sprites.pipes[pipe_color]
+        self.pipe_image_flipped = self.sprites.pipes_flipped[pipe_color]
         self.pipes.clear()
         self.pipe_spawn_timer = 0.0
         self.bird_frames = self.sprites.birds[random.choice(["yellow", "blue", "red"])]
@@ -297,45 +387,47 @@ class Game:
         # Constant gap size - no difficulty progression
         current_gap = self.base_pipe_gap  # Keep gap constant throughout the game
         
-        min_center = int(self.screen_height * 0.25) + current_gap // 2
-        max_center = int(self.base_y - 20 - current_gap // 2)
+        min_center = self._spawn_min_center_base + current_gap // 2
+        max_center = self._spawn_max_center_base - current_gap // 2
         gap_center = random.randint(min_center, max_center)
-        self.pipes.append(PipePair(self.pipe_image, self.screen_width + 10, 
-                                   gap_center, current_gap, self.base_y))
+        self.pipes.append(PipePair(self.pipe_image, self.pipe_image_flipped,
+                                   self.screen_width + 10, gap_center, current_gap, self.base_y))
 
     def update_base(self, dt: float) -> None:
         self.base_x -= self.base_speed * dt
         if self.base_x <= -(self.base.get_width() - self.screen_width):
             self.base_x = 0.0
 
+    def _step_pipes(self, bird_rect: pygame.Rect, bird_x: float) -> bool:
+        """Score passed pipes and collision-test the bird in one traversal."""
+        all_rects: List[pygame.Rect] = []
+        for pipe in self.pipes:
+            if not pipe.passed and pipe.x + pipe._w < bird_x:
+                pipe.passed = True
+                self.score += 1
+                if self.score > self.high_score:
+                    # Track in memory only; the file is written on game over
+                    self.high_score = self.score
+                    self._high_score_dirty = True
+                self.sounds.play("point")
+            all_rects.extend(pipe.rects())
+        return bird_rect.collidelist(all_rects) != -1
+
     def check_collisions(self) -> bool:
         bird_rect = self.bird.rect()
-        
-        # Check ground collision
+
+        # Pipes first so a pass still scores on the frame the bird dies
+        hit = self._step_pipes(bird_rect, self.bird.position_x)
+
+        # Ground collision
         if bird_rect.bottom >= self.base_y - 5:
             return True
-        
-        # Check ceiling collision
+
+        # Ceiling collision
         if bird_rect.top <= 0:
             return True
 
-        # Use simple rect collision for better performance
-        for pipe in self.pipes:
-            top_rect, bottom_rect = pipe.rects()
-            if bird_rect.colliderect(top_rect) or bird_rect.colliderect(bottom_rect):
-                return True
-        
-        return False
-
-    def update_score(self) -> None:
-        for pipe in self.pipes:
-            if not pipe.passed and pipe.x + pipe.width < self.bird.position_x:
-                pipe.passed = True
-                self.score += 1
-                if self.score > self.high_score:
-                    self.high_score = self.score
-                    self._save_high_score()
-                self.sounds.play("point")
+        return hit
 
     def handle_input(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN and event.key in (pygame.K_SPACE, pygame.K_UP):
@@ -359,108 +451,151 @@ class Game:
             elif self.state == "GAME_OVER":
                 self.reset()
 
+    def _render_number(self, value: int) -> pygame.Surface:
+        """Composite the digits of a value into one cached surface."""
+        strip = self._score_cache.get(value)
+        if strip is None:
+            widths = self.sprites.digit_widths
+            digits = [int(d) for d in str(value)]
+            total_width = sum(widths[d] for d in digits)
+            strip = pygame.Surface((total_width, self.sprites.digits[0].get_height()), pygame.SRCALPHA)
+            x = 0
+            for d in digits:
+                strip.blit(self.sprites.digits[d], (x, 0))
+                x += widths[d]
+            strip = strip.convert_alpha()
+            self._score_cache[value] = strip
+        return strip
+
     def draw_score(self, surface: pygame.Surface) -> None:
-        digits = [int(d) for d in str(self.score)]
-        total_width = sum(self.sprites.digits[d].get_width() for d in digits)
-        x = (self.screen_width - total_width) // 2
+        strip = self._render_number(self.score)
+        x = (self.screen_width - strip.get_width()) // 2
         y = int(self.screen_height * 0.12)
-        for d in digits:
-            img = self.sprites.digits[d]
-            surface.blit(img, (x, y))
-            x += img.get_width()
+        surface.blit(strip, (x, y))
 
     def draw_high_score(self, surface: pygame.Surface) -> None:
         if self.state != "GAME_OVER":
             return
-        
-        # Draw "High Score" label (using score digits creatively)
-        y = int(self.screen_height * 0.35)
-        
-        text_digits = [int(d) for d in str(self.high_score)]
-        total_width = sum(self.sprites.digits[d].get_width() for d in text_digits)
-        x = (self.screen_width - total_width) // 2
+        strip = self._render_number(self.high_score)
+        x = (self.screen_width - strip.get_width()) // 2
         y = int(self.screen_height * 0.40)
-        for d in text_digits:
-            img = self.sprites.digits[d]
-            surface.blit(img, (x, y))
-            x += img.get_width()
+        surface.blit(strip, (x, y))
 
     def run(self) -> None:
         running = True
         death_sound_played = False
-        
+        last_drawn_state = ""
+
+        # Hoist invariant lookups out of the 60Hz loop (LOAD_ATTR -> LOAD_FAST);
+        # bird/background are re-read each frame since reset() replaces them
+        screen = self.screen
+        clock = self.clock
+        fps = self.fps
+        base_strip = self.base_strip
+        base_area = pygame.Rect(0, 0, self.screen_width, self.base.get_height())
+        base_y = self.base_y
+        event_get = pygame.event.get
+
+        # Only these event types are ever handled; let SDL filter the rest
+        handled_events = (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN)
+
         while running:
-            dt_ms = self.clock.tick(self.fps)
+            dt_ms = clock.tick(fps)
             dt = dt_ms / 1000.0
 
-            for event in pygame.event.get():
+            for event in event_get(handled_events):
                 if event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                     running = False
                 else:
                     self.handle_input(event)
+            pygame.event.clear()  # drop unhandled types (mouse motion etc.)
 
             # Update base animation always
             self.update_base(dt)
 
+            bird = self.bird
+
             if self.state == "WELCOME":
                 # Bird idle animation
-                self.bird.update(dt, self.gravity, self.rotation_speed, is_playing=False)
-                
+                bird.update(dt, self.gravity, self.rotation_speed, is_playing=False)
+
             elif self.state == "PLAYING":
-                self.bird.update(dt, self.gravity, self.rotation_speed, is_playing=True)
-                
+                bird.update(dt, self.gravity, self.rotation_speed, is_playing=True)
+
                 # Spawn pipes
                 self.pipe_spawn_timer += dt
                 if self.pipe_spawn_timer >= self.pipe_spawn_interval:
                     self.pipe_spawn_timer = 0.0
                     self.spawn_pipe()
 
-                # Update pipes
-                for pipe in list(self.pipes):
+                # Update pipes and drop off-screen ones in the same pass
+                kept: List[PipePair] = []
+                for pipe in self.pipes:
                     pipe.update(dt)
-                self.pipes = [p for p in self.pipes if p.x + p.width > -50]
+                    if pipe.x + pipe._w > -50:
+                        kept.append(pipe)
+                self.pipes = kept
 
-                # Check collisions
+                # Check collisions (also advances pipe pass/score state)
                 if self.check_collisions():
                     self.state = "GAME_OVER"
-                    self.bird.dead = True
+                    bird.dead = True
                     death_sound_played = False
                     self.sounds.play("hit")
-
-                self.update_score()
+                    if self._high_score_dirty:
+                        self._save_high_score()
 
             elif self.state == "GAME_OVER":
-                self.bird.update(dt, self.gravity * 1.5, self.rotation_speed, is_playing=True)
-                if not death_sound_played and self.bird.rect().bottom >= self.base_y - 1:
+                bird.update(dt, self.gravity * 1.5, self.rotation_speed, is_playing=True)
+                if not death_sound_played and bird.rect().bottom >= base_y - 1:
                     death_sound_played = True
                     self.sounds.play("die")
 
             # Render everything
-            self.screen.blit(self.background, (0, 0))
-            
+            screen.blit(self.background, (0, 0))
+
             for pipe in self.pipes:
-                pipe.draw(self.screen)
-            
-            self.screen.blit(self.base, (int(self.base_x), self.base_y))
-            self.screen.blit(self.base, (int(self.base_x) + self.base.get_width(), self.base_y))
-            
-            self.bird.draw(self.screen)
+                pipe.draw(screen)
+
+            base_area.x = int(-self.base_x)
+            screen.blit(base_strip, (0, base_y), area=base_area)
+
+            bird_rect = bird.draw(screen)
 
             if self.state == "WELCOME":
                 msg_rect = self.sprites.message.get_rect(center=(self.screen_width // 2, int(self.screen_height * 0.40)))
-                self.screen.blit(self.sprites.message, msg_rect.topleft)
+                screen.blit(self.sprites.message, msg_rect.topleft)
             elif self.state == "PLAYING":
-                self.draw_score(self.screen)
+                self.draw_score(screen)
             elif self.state == "GAME_OVER":
                 go_rect = self.sprites.gameover.get_rect(center=(self.screen_width // 2, int(self.screen_height * 0.20)))
-                self.screen.blit(self.sprites.gameover, go_rect.topleft)
-                self.draw_score(self.screen)
-                self.draw_high_score(self.screen)
-
-            pygame.display.flip()
-
+                screen.blit(self.sprites.gameover, go_rect.topleft)
+                self.draw_score(screen)
+                self.draw_high_score(screen)
+
+            dirty = [bird_rect,
+                     pygame.Rect(0, base_y, self.screen_width, base_area.height)]
+            if self.state == "PLAYING":
+                for pipe in self.pipes:
+                    dirty.append(pygame.Rect(int(pipe.x) - 2, 0, pipe.width + 4, base_y))
+                dirty.append(pygame.Rect(0, int(self.screen_height * 0.12),
+                                         self.screen_width, self.sprites.digits[0].get_height()))
+            if self.state != last_drawn_state:
+                # Static UI just changed (message/game over); push the full
+                # frame once, then go back to tracking dirty regions
+                pygame.display.flip()
+                last_drawn_state = self.state
+            else:
+                pygame.display.update(dirty + self._prev_dirty)
+            # Either way the next frame must erase this frame's sprites,
+            # or e.g. the bird's death position would ghost on screen
+            self._prev_dirty = dirty
+
+        # Don't lose a record that was still waiting for the game-over flush
+        if self._high_score_dirty:
+            self._save_high_score()
         pygame.quit()
 
 
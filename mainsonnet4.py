@@ -2,7 +2,8 @@ import os
 import sys
 import random
 import math
-from typing import List, Tuple, Dict
+from collections import deque
+from typing import Deque, List, Optional, Tuple, Dict
 
 # Ensure a real Windows video driver is used (avoid 'dummy' headless driver)
 if os.name == "nt":
@@ -17,16 +18,34 @@ def get_resource_path(*parts: str) -> str:
     return os.path.join(base_dir, *parts)
 
 
+# Bird rotation is served from a table of pre-rotated frames covering
+# -90..+90 degrees in ROT_STEP buckets, built once at sprite load
+ROT_STEP = 5
+
+# 256-sample sine table for the idle wobble; one mask + index instead of
+# a libm call per frame
+_SIN_LUT = [math.sin(2 * math.pi * i / 256) for i in range(256)]
+_SIN_MASK = 255
+_SIN_SCALE = 256 / (2 * math.pi)
+
+
 class SpriteLibrary:
     def __init__(self, screen_scale: float = 1.0) -> None:
         self.scale = screen_scale
         self.backgrounds: Dict[str, pygame.Surface] = {}
         self.base: pygame.Surface
         self.birds: Dict[str, List[pygame.Surface]] = {}
+        # bird_rotations[color][frame][bucket] -> pre-rotated surface;
+        # bird_rotation_offsets holds the matching half-sizes for centering
+        self.bird_rotations: Dict[str, List[List[pygame.Surface]]] = {}
+        self.bird_rotation_offsets: Dict[str, List[List[Tuple[int, int]]]] = {}
+        # Per-frame collision masks for the narrow-phase pixel test
+        self.bird_masks: Dict[str, List[pygame.mask.Mask]] = {}
         self.pipes: Dict[str, pygame.Surface] = {}
         self.message: pygame.Surface
         self.gameover: pygame.Surface
         self.digits: List[pygame.Surface] = []
+        self.digit_widths: List[int] = []
         self._load_all()
 
     def _load_image(self, *path: str, convert_alpha: bool = True) -> pygame.Surface:
@@ -43,10 +62,12 @@ class SpriteLibrary:
         return pygame.transform.smoothscale(surface, (width, height))
 
     def _load_all(self) -> None:
-        self.backgrounds["day"] = self._scale_surface(self._load_image("sprites", "background-day.png"))
-        self.backgrounds["night"] = self._scale_surface(self._load_image("sprites", "background-night.png"))
+        # Backgrounds and base are opaque: plain convert() blits without
+        # alpha blending, which is faster still
+        self.backgrounds["day"] = self._scale_surface(self._load_image("sprites", "background-day.png", convert_alpha=False))
+        self.backgrounds["night"] = self._scale_surface(self._load_image("sprites", "background-night.png", convert_alpha=False))
 
-        self.base = self._scale_surface(self._load_image("sprites", "base.png"))
+        self.base = self._scale_surface(self._load_image("sprites", "base.png", convert_alpha=False))
 
         bird_sets = {
             "yellow": [
@@ -68,21 +89,36 @@ class SpriteLibrary:
         for color, files in bird_sets.items():
             frames = [self._scale_surface(self._load_image("sprites", f)) for f in files]
             self.birds[color] = frames
+            rotations: List[List[pygame.Surface]] = []
+            offsets: List[List[Tuple[int, int]]] = []
+            for frame in frames:
+                rotated = [pygame.transform.rotate(frame, -angle)
+                           for angle in range(-90, 91, ROT_STEP)]
+                rotations.append(rotated)
+                offsets.append([(s.get_width() // 2, s.get_height() // 2) for s in rotated])
+            self.bird_rotations[color] = rotations
+            self.bird_rotation_offsets[color] = offsets
+            self.bird_masks[color] = [pygame.mask.from_surface(f) for f in frames]
 
         self.pipes["green"] = self._scale_surface(self._load_image("sprites", "pipe-green.png"))
         self.pipes["red"] = self._scale_surface(self._load_image("sprites", "pipe-red.png"))
+        # Flipped variants shared by every PipePair instance
+        self.pipes_flipped = {k: pygame.transform.flip(v, False, True)
+                              for k, v in self.pipes.items()}
 
         self.message = self._scale_surface(self._load_image("sprites", "message.png"))
         self.gameover = self._scale_surface(self._load_image("sprites", "gameover.png"))
 
         for i in range(10):
             self.digits.append(self._scale_surface(self._load_image("sprites", f"{i}.png")))
+        self.digit_widths = [s.get_width() for s in self.digits]
 
 
 class SoundLibrary:
     def __init__(self) -> None:
         self.enabled = False
         self.sounds: Dict[str, pygame.mixer.Sound] = {}
+        self.channels: Dict[str, pygame.mixer.Channel] = {}
         self._init_mixer()
         self._load_sounds()
 
@@ -108,18 +144,29 @@ class SoundLibrary:
     def _load_sounds(self) -> None:
         for n in ("wing", "point", "die", "hit", "swoosh"):
             self._try_load(n)
+        if self.enabled and self.sounds:
+            # One dedicated channel per effect: play() hands the sound to a
+            # known channel instead of scanning the mixer for a free one
+            pygame.mixer.set_num_channels(max(8, len(self.sounds)))
+            self.channels = {name: pygame.mixer.Channel(i)
+                             for i, name in enumerate(self.sounds)}
 
     def play(self, name: str) -> None:
-        if self.enabled and name in self.sounds:
-            try:
-                self.sounds[name].play()
-            except Exception:
-                pass
+        channel = self.channels.get(name)
+        if channel is not None:
+            channel.play(self.sounds[name])
 
 
 class Bird:
-    def __init__(self, frames: List[pygame.Surface], start_pos: Tuple[int, int]) -> None:
+    def __init__(self, frames: List[pygame.Surface], start_pos: Tuple[int, int],
+                 rotations: List[List[pygame.Surface]],
+                 rotation_offsets: List[List[Tuple[int, int]]],
+                 masks: List[pygame.mask.Mask]) -> None:
         self.frames = frames
+        self.rotations = rotations
+        self.rotation_offsets = rotation_offsets
+        self.masks = masks
+        self.num_buckets = len(rotations[0])
         self.animation_index = 0
         self.animation_timer = 0.0
         self.animation_interval = 0.1
@@ -127,24 +174,35 @@ class Bird:
         self.initial_y = start_pos[1]  # Store initial position for wobble
         self.velocity_y = 0.0
         self.rotation = 0.0
+        # Continuous accumulator behind the quantized public rotation, so
+        # smoothing keeps converging even when a step is below ROT_STEP
+        self._rotation_f = 0.0
         self.dead = False
         self.max_fall_speed = 400.0
         self.wobble_amplitude = 8.0
         self.wobble_timer = 0.0
         
-        # Get bird center for proper rotation
-        self.center_x = self.frames[0].get_width() // 2
-        self.center_y = self.frames[0].get_height() // 2
+        # Frame size is constant; cache it with the bird center for rotation
+        self._w = self.frames[0].get_width()
+        self._h = self.frames[0].get_height()
+        self.center_x = self._w // 2
+        self.center_y = self._h // 2
+        # Current frame, refreshed once per update() instead of recomputing
+        # index % len on every image access
+        self._frame_idx = 0
+        self._current_image = frames[0]
 
     @property
     def image(self) -> pygame.Surface:
-        return self.frames[int(self.animation_index) % len(self.frames)]
+        return self._current_image
 
     def rect(self) -> pygame.Rect:
-        img = self.image
-        rect = pygame.Rect(int(self.position_x), int(self.position_y), img.get_width(), img.get_height())
-        rect.inflate_ip(-8, -8)
-        return rect
+        # The +4/-8 is the old inflate_ip(-8, -8) hitbox shrink
+        return pygame.Rect(int(self.position_x) + 4, int(self.position_y) + 4,
+                           self._w - 8, self._h - 8)
+
+    def current_mask(self) -> pygame.mask.Mask:
+        return self.masks[self._frame_idx]
 
     def get_center(self) -> Tuple[float, float]:
         """Get the center point of the bird for rotation"""
@@ -159,6 +217,8 @@ class Bird:
             if self.animation_timer >= self.animation_interval:
                 self.animation_timer = 0.0
                 self.animation_index = (self.animation_index + 1) % len(self.frames)
+        self._frame_idx = self.animation_index
+        self._current_image = self.frames[self._frame_idx]
 
         if is_playing:
             # Apply gravity with terminal velocity
@@ -172,69 +232,92 @@ class Bird:
             else:  # Rising
                 target_rotation = max(-30, self.velocity_y * 0.2)
                 
-            rotation_diff = target_rotation - self.rotation
-            self.rotation += rotation_diff * min(1.0, rotation_speed * dt)
+            rotation_diff = target_rotation - self._rotation_f
+            if rotation_diff:
+                self._rotation_f += rotation_diff * min(1.0, rotation_speed * dt)
+                # Snap to the atlas granularity; the blit path then always
+                # lands exactly on a pre-rotated bucket
+                self.rotation = round(self._rotation_f / ROT_STEP) * ROT_STEP
         else:
             # Idle wobble animation - smooth sine wave
             self.wobble_timer += dt * 2.0  # Speed of wobble
-            wobble_offset = self.wobble_amplitude * math.sin(self.wobble_timer)
+            wobble_offset = self.wobble_amplitude * _SIN_LUT[int(self.wobble_timer * _SIN_SCALE) & _SIN_MASK]
             self.position_y = self.initial_y + wobble_offset
             self.rotation = 0
+            self._rotation_f = 0.0
 
     def flap(self, impulse: float) -> None:
         if not self.dead:
             self.velocity_y = -impulse
 
-    def draw(self, surface: pygame.Surface) -> None:
-        # Get the current image
-        current_image = self.image
-        
-        # Rotate the image around its center
-        if abs(self.rotation) > 0.1:  # Only rotate if necessary
-            rotated_image = pygame.transform.rotate(current_image, -self.rotation)  # Negative for correct direction
-            # Calculate the new position to keep the rotation centered
-            old_center = self.get_center()
-            new_rect = rotated_image.get_rect(center=old_center)
-            surface.blit(rotated_image, new_rect.topleft)
-        else:
+    def blit_args(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Surface and position for the current frame, ready for blit/blits."""
+        if abs(self.rotation) < 0.5:
             # No rotation needed
-            surface.blit(current_image, (int(self.position_x), int(self.position_y)))
+            return self._current_image, (int(self.position_x), int(self.position_y))
+        # Pick the nearest pre-rotated bucket instead of resampling
+        bucket = max(0, min(self.num_buckets - 1, int((self.rotation + 90) / ROT_STEP)))
+        rotated = self.rotations[self._frame_idx][bucket]
+        half_w, half_h = self.rotation_offsets[self._frame_idx][bucket]
+        cx, cy = self.get_center()
+        return rotated, (int(cx) - half_w, int(cy) - half_h)
+
+    def draw(self, surface: pygame.Surface) -> pygame.Rect:
+        surf, pos = self.blit_args()
+        surface.blit(surf, pos)
+        return pygame.Rect(pos, surf.get_size())
 
 
 class PipePair:
-    def __init__(self, pipe_image: pygame.Surface, x: int, gap_y: int, gap_size: int, bottom_y: int, speed: float) -> None:
+    def __init__(self, pipe_image: pygame.Surface, pipe_image_flipped: pygame.Surface,
+                 x: int, gap_y: int, gap_size: int, bottom_y: int, speed: float) -> None:
+        self.reset(pipe_image, pipe_image_flipped, x, gap_y, gap_size, bottom_y, speed)
+
+    def reset(self, pipe_image: pygame.Surface, pipe_image_flipped: pygame.Surface,
+              x: int, gap_y: int, gap_size: int, bottom_y: int, speed: float) -> None:
+        """(Re)initialize; lets culled pairs be recycled from a free list."""
         self.pipe_image = pipe_image
-        self.pipe_image_flipped = pygame.transform.flip(pipe_image, False, True)
+        self.pipe_image_flipped = pipe_image_flipped
         self.x = float(x)
         self.gap_y = gap_y
         self.gap_size = gap_size
         self.bottom_y = bottom_y
         self.speed = speed
         self.passed = False
+        # Vertical geometry and size never change after construction
+        self._w = pipe_image.get_width()
+        self._h = pipe_image.get_height()
+        self._top_y = self.gap_y - self.gap_size // 2 - self._h
+        self._bot_y = self.gap_y + self.gap_size // 2
+        self._rects: Optional[Tuple[pygame.Rect, pygame.Rect]] = None
 
     @property
     def width(self) -> int:
-        return self.pipe_image.get_width()
+        return self._w
 
     def rects(self) -> Tuple[pygame.Rect, pygame.Rect]:
-        top_height = self.gap_y - self.gap_size // 2
-        bottom_top = self.gap_y + self.gap_size // 2
-        top_rect = pygame.Rect(int(self.x), int(top_height) - self.pipe_image.get_height(), 
-                                self.width, self.pipe_image.get_height())
-        bottom_rect = pygame.Rect(int(self.x), int(bottom_top), self.width, self.pipe_image.get_height())
-        top_rect.inflate_ip(-4, 0)
-        bottom_rect.inflate_ip(-4, 0)
-        return top_rect, bottom_rect
+        if self._rects is None:
+            # The -4/+2 bakes in the old inflate_ip(-4, 0) hitbox shrink
+            px = int(self.x) + 2
+            self._rects = (pygame.Rect(px, self._top_y, self._w - 4, self._h),
+                           pygame.Rect(px, self._bot_y, self._w - 4, self._h))
+        return self._rects
 
     def update(self, dt: float) -> None:
         self.x -= self.speed * dt
+        self._rects = None
+
+    def blit_args(self) -> Tuple[Tuple[pygame.Surface, Tuple[int, int]],
+                                 Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Both pipe halves as (surface, pos) pairs for blit/blits."""
+        x = int(self.x) - 2
+        return ((self.pipe_image_flipped, (x, self._top_y)),
+                (self.pipe_image, (x, self._bot_y)))
 
     def draw(self, surface: pygame.Surface) -> None:
-        top_rect, bottom_rect = self.rects()
-        draw_top = pygame.Rect(int(self.x) - 2, top_rect.top, self.width, top_rect.height)
-        draw_bottom = pygame.Rect(int(self.x) - 2, bottom_rect.top, self.width, bottom_rect.height)
-        surface.blit(self.pipe_image_flipped, draw_top.topleft)
-        surface.blit(self.pipe_image, draw_bottom.topleft)
+        top, bottom = self.blit_args()
+        surface.blit(*top)
+        surface.blit(*bottom)
 
 
 class DifficultySettings:
@@ -256,23 +339,39 @@ class Game:
     def __init__(self) -> None:
         pygame.init()
 
+        # The display must exist before SpriteLibrary loads anything, or
+        # _load_image skips convert()/convert_alpha() and every blit pays a
+        # per-call pixel-format conversion. Probe the background for size.
+        pygame.display.init()
+        probe = pygame.image.load(get_resource_path("sprites", "background-day.png"))
+        self.screen_width, self.screen_height = probe.get_size()
+        # Ask SDL for a GPU-backed, double-buffered window with vsync; the
+        # SCALED flag routes presentation through a hardware texture. Fall
+        # back to the plain software surface where that's unavailable.
+        try:
+            self.screen = pygame.display.set_mode(
+                (self.screen_width, self.screen_height),
+                pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
+        except pygame.error:
+            self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
+        if pygame.display.get_surface() is None:
+            raise RuntimeError("Failed to initialize video display")
+        pygame.display.set_caption("Flappy Bird")
+        # Only the event types the loop handles may enter the queue; mouse
+        # motion and the rest never become Python objects
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN])
+
         self.sprites = SpriteLibrary()
         self.sounds = SoundLibrary()
         self.difficulty_settings = DifficultySettings()
 
         self.background_key = random.choice(["day", "night"])
         self.background = self.sprites.backgrounds[self.background_key]
-        self.screen_width = self.background.get_width()
-        self.screen_height = self.background.get_height()
-        pygame.display.init()
-        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
-        pygame.event.pump()
-        if pygame.display.get_surface() is None:
-            raise RuntimeError("Failed to initialize video display")
-        pygame.display.set_caption("Flappy Bird")
 
         self.clock = pygame.time.Clock()
         self.fps = 60
+        self._inv_1000 = 0.001  # ms -> s without a per-frame division
 
         # Score font (kept minimal UI)
         try:
@@ -284,18 +383,54 @@ class Game:
         self.base_y = self.screen_height - self.base.get_height()
         self.base_x = 0.0
 
-        self.pipe_image = self.sprites.pipes[random.choice(["green", "red"])]
-        self.pipes: List[PipePair] = []
+        pipe_color = random.choice(["green", "red"])
+        self.pipe_image = self.sprites.pipes[pipe_color]
+        self.pipe_image_flipped = self.sprites.pipes_flipped[pipe_color]
+        # Pipes are strictly FIFO (spawn right, cull left) so a deque lets
+        # expired ones be popped without rebuilding the container
+        self.pipes: Deque[PipePair] = deque()
+        # Culled pairs land here and are reset on the next spawn
+        self._pipe_pool: List[PipePair] = []
         self.pipe_spawn_timer = 0.0
 
-        self.bird_frames = self.sprites.birds[random.choice(["yellow", "blue", "red"])]
-        self.bird = Bird(self.bird_frames, (self.screen_width // 4, self.screen_height // 2))
+        bird_color = random.choice(["yellow", "blue", "red"])
+        self.bird_frames = self.sprites.birds[bird_color]
+        self.bird = Bird(self.bird_frames, (self.screen_width // 4, self.screen_height // 2),
+                         self.sprites.bird_rotations[bird_color],
+                         self.sprites.bird_rotation_offsets[bird_color],
+                         self.sprites.bird_masks[bird_color])
         self.rotation_speed = 6.0
+        # Pipes are fully opaque rectangles, so one shared solid mask sized
+        # to the (shrunk) pipe rect serves the narrow-phase test
+        self._solid_pipe_mask = pygame.mask.Mask(
+            (self.pipe_image.get_width() - 4, self.pipe_image.get_height()), fill=True)
 
         self.state = "WELCOME"
         self.score = 0
         self.high_score = self._load_high_score()
+        # What the file currently holds; a record beyond this is flushed
+        # on game over or, at the latest, on quit
+        self._saved_high_score = self.high_score
+        # Composited digit strips, rebuilt only when the value changes
+        self._score_cached = -1
+        self._score_surface: Optional[pygame.Surface] = None
+        self._high_score_cached = -1
+        self._high_score_surface: Optional[pygame.Surface] = None
         self._apply_difficulty_settings()
+        self._build_welcome_static()
+
+    def _build_welcome_static(self) -> None:
+        """Pre-composite background + welcome message for partial redraws."""
+        static = self.background.copy()
+        msg_rect = self.sprites.message.get_rect(
+            center=(self.screen_width // 2, int(self.screen_height * 0.40)))
+        static.blit(self.sprites.message, msg_rect.topleft)
+        self._welcome_static = static
+        self._msg_topleft = msg_rect.topleft
+        # Bird rect drawn last frame; None forces one full redraw
+        self._welcome_prev_bird: Optional[pygame.Rect] = None
+        # Regions repainted last frame while PLAYING, erased next frame
+        self._prev_dirty: List[pygame.Rect] = []
 
     def _apply_difficulty_settings(self):
         """Apply current difficulty settings to game parameters"""
@@ -305,6 +440,13 @@ class Game:
         self.pipe_gap = settings["pipe_gap"]
         self.base_speed = settings["pipe_speed"]
         self.pipe_spawn_interval = settings["pipe_interval"]
+        # Spawn bounds depend only on gap size; precompute them and fill a
+        # ring of gap centers so spawns skip random.randint entirely
+        self._min_center = int(self.screen_height * 0.25) + self.pipe_gap // 2
+        self._max_center = int(self.base_y - 20 - self.pipe_gap // 2)
+        self._gap_pool = [random.randint(self._min_center, self._max_center)
+                          for _ in range(256)]
+        self._gap_idx = 0
 
     def _load_high_score(self) -> int:
         try:
@@ -317,6 +459,7 @@ class Game:
         try:
             with open("highscore.txt", "w") as f:
                 f.write(str(self.high_score))
+            self._saved_high_score = self.high_score
         except:
             pass
 
@@ -324,20 +467,35 @@ class Game:
         self.background_key = "night" if self.background_key == "day" else "day"
         self.background = self.sprites.backgrounds[self.background_key]
         self.base_x = 0.0
-        self.pipe_image = self.sprites.pipes[random.choice(["green", "red"])]
+        pipe_color = random.choice(["green", "red"])
+        self.pipe_image = self.sprites.pipes[pipe_color]
+        self.pipe_image_flipped = self.sprites.pipes_flipped[pipe_color]
+        self._pipe_pool.extend(self.pipes)
         self.pipes.clear()
         self.pipe_spawn_timer = 0.0
-        self.bird_frames = self.sprites.birds[random.choice(["yellow", "blue", "red"])]
-        self.bird = Bird(self.bird_frames, (self.screen_width // 4, self.screen_height // 2))
+        bird_color = random.choice(["yellow", "blue", "red"])
+        self.bird_frames = self.sprites.birds[bird_color]
+        self.bird = Bird(self.bird_frames, (self.screen_width // 4, self.screen_height // 2),
+                         self.sprites.bird_rotations[bird_color],
+                         self.sprites.bird_rotation_offsets[bird_color],
+                         self.sprites.bird_masks[bird_color])
         self.score = 0
         self.state = "WELCOME"
+        self._build_welcome_static()
 
     def spawn_pipe(self) -> None:
-        min_center = int(self.screen_height * 0.25) + self.pipe_gap // 2
-        max_center = int(self.base_y - 20 - self.pipe_gap // 2)
-        gap_center = random.randint(min_center, max_center)
-        self.pipes.append(PipePair(self.pipe_image, self.screen_width + 10, 
-                                   gap_center, self.pipe_gap, self.base_y, self.base_speed))
+        gap_center = self._gap_pool[self._gap_idx]
+        self._gap_idx = (self._gap_idx + 1) & 255
+        if self._pipe_pool:
+            pipe = self._pipe_pool.pop()
+            pipe.reset(self.pipe_image, self.pipe_image_flipped,
+                       self.screen_width + 10, gap_center,
+                       self.pipe_gap, self.base_y, self.base_speed)
+        else:
+            pipe = PipePair(self.pipe_image, self.pipe_image_flipped,
+                            self.screen_width + 10, gap_center,
+                            self.pipe_gap, self.base_y, self.base_speed)
+        self.pipes.append(pipe)
 
     def update_base(self, dt: float) -> None:
         self.base_x -= self.base_speed * dt
@@ -353,11 +511,26 @@ class Game:
         if bird_rect.top <= 0:
             return True
 
+        # Pipes are ordered left-to-right, so only the one or two spanning
+        # the bird's x-range can possibly collide
+        bird_left = bird_rect.left
+        bird_right = bird_rect.right
         for pipe in self.pipes:
+            if pipe.x > bird_right:
+                break
+            if pipe.x + pipe.width < bird_left:
+                continue
             top_rect, bottom_rect = pipe.rects()
-            if bird_rect.colliderect(top_rect) or bird_rect.colliderect(bottom_rect):
-                return True
-        
+            for rect in (top_rect, bottom_rect):
+                if not bird_rect.colliderect(rect):
+                    continue
+                # AABB hit: confirm with a pixel-precise overlap so the
+                # transparent corners of the bird frame don't count
+                offset = (rect.x - int(self.bird.position_x),
+                          rect.y - int(self.bird.position_y))
+                if self.bird.current_mask().overlap(self._solid_pipe_mask, offset):
+                    return True
+
         return False
 
     def update_score(self) -> None:
@@ -366,8 +539,9 @@ class Game:
                 pipe.passed = True
                 self.score += 1
                 if self.score > self.high_score:
+                    # In-memory only; the file write waits for game over so
+                    # a pipe pass never pays filesystem latency
                     self.high_score = self.score
-                    self._save_high_score()
                 self.sounds.play("point")
 
     def handle_difficulty_input(self, event: pygame.event.Event) -> None:
@@ -395,38 +569,84 @@ class Game:
             elif self.state == "GAME_OVER":
                 self.reset()
 
-    def draw_score(self, surface: pygame.Surface) -> None:
-        digits = [int(d) for d in str(self.score)]
-        total_width = sum(self.sprites.digits[d].get_width() for d in digits)
-        x = (self.screen_width - total_width) // 2
-        y = int(self.screen_height * 0.12)
+    def _compose_number(self, value: int) -> pygame.Surface:
+        """Blit a number's digits once into a single reusable surface."""
+        widths = self.sprites.digit_widths
+        digits = [int(d) for d in str(value)]
+        total_width = sum(widths[d] for d in digits)
+        height = self.sprites.digits[0].get_height()
+        strip = pygame.Surface((total_width, height), pygame.SRCALPHA)
+        x = 0
         for d in digits:
-            img = self.sprites.digits[d]
-            surface.blit(img, (x, y))
-            x += img.get_width()
+            strip.blit(self.sprites.digits[d], (x, 0))
+            x += widths[d]
+        return strip
+
+    def draw_score(self, surface: pygame.Surface) -> None:
+        if self._score_cached != self.score:
+            self._score_cached = self.score
+            self._score_surface = self._compose_number(self.score)
+        x = (self.screen_width - self._score_surface.get_width()) // 2
+        surface.blit(self._score_surface, (x, int(self.screen_height * 0.12)))
 
     def draw_high_score(self, surface: pygame.Surface) -> None:
         if self.state != "GAME_OVER":
             return
-        text_digits = [int(d) for d in str(self.high_score)]
-        total_width = sum(self.sprites.digits[d].get_width() for d in text_digits)
-        x = (self.screen_width - total_width) // 2
-        y = int(self.screen_height * 0.40)
-        for d in text_digits:
-            img = self.sprites.digits[d]
-            surface.blit(img, (x, y))
-            x += img.get_width()
+        if self._high_score_cached != self.high_score:
+            self._high_score_cached = self.high_score
+            self._high_score_surface = self._compose_number(self.high_score)
+        x = (self.screen_width - self._high_score_surface.get_width()) // 2
+        surface.blit(self._high_score_surface, (x, int(self.screen_height * 0.40)))
 
     def draw_difficulty_menu(self, surface: pygame.Surface) -> None:
         pass
 
+    def _playing_dirty(self, bird_rect: pygame.Rect, step: int) -> List[pygame.Rect]:
+        """Screen regions a PLAYING frame repaints.
+
+        Every rect except the bird's also covers its own position last
+        frame: the base row and score strip sit still (the strip is
+        centred and can only grow), and the pipe rects are widened by
+        the scroll step, so only the bird needs separate prev tracking.
+        """
+        screen_w = self.screen_width
+        base_y = self.base_y
+        dirty = [bird_rect,
+                 pygame.Rect(0, base_y, screen_w, self.base.get_height())]
+        strip = self._score_surface
+        if strip is not None:
+            dirty.append(pygame.Rect((screen_w - strip.get_width()) // 2,
+                                     int(self.screen_height * 0.12),
+                                     strip.get_width(), strip.get_height()))
+        for pipe in self.pipes:
+            # Sprite-sized rects clipped to the playfield keep the area
+            # sum honest; the gap between the halves stays untouched
+            x = int(pipe.x) - 2
+            w = pipe.width + 4 + step
+            if x < 0:
+                w += x
+                x = 0
+            if x + w > screen_w:
+                w = screen_w - x
+            if w <= 0:
+                continue
+            gap_top = pipe._top_y + pipe._h
+            if gap_top > 0:
+                dirty.append(pygame.Rect(x, 0, w, gap_top))
+            bot_h = base_y - pipe._bot_y
+            if bot_h > 0:
+                dirty.append(pygame.Rect(x, pipe._bot_y, w, bot_h))
+        return dirty
+
     def run(self) -> None:
         running = True
         death_sound_played = False
-        
+        last_drawn_state: Optional[str] = None
+        screen_area = self.screen_width * self.screen_height
+
         while running:
-            dt_ms = self.clock.tick(self.fps)
-            dt = dt_ms / 1000.0
+            # Multiply by the cached reciprocal instead of dividing
+            dt = self.clock.tick(self.fps) * self._inv_1000
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -451,19 +671,22 @@ class Game:
                     self.pipe_spawn_timer = 0.0
                     self.spawn_pipe()
 
-                # Update pipes
-                for pipe in list(self.pipes):
+                # Update pipes; only the leftmost can expire
+                for pipe in self.pipes:
                     pipe.update(dt)
-                self.pipes = [p for p in self.pipes if p.x + p.width > -50]
+                while self.pipes and self.pipes[0].x + self.pipes[0].width <= -50:
+                    self._pipe_pool.append(self.pipes.popleft())
+
+                # Score first so a pipe cleared on the death frame still
+                # counts before the high score is flushed below
+                self.update_score()
 
-                # Check collisions
                 if self.check_collisions():
                     self.state = "GAME_OVER"
                     self.bird.dead = True
                     death_sound_played = False
                     self.sounds.play("hit")
-
-                self.update_score()
+                    self._save_high_score()
 
             elif self.state == "GAME_OVER":
                 self.bird.update(dt, self.gravity * 1.5, self.rotation_speed, is_playing=True)
@@ -472,21 +695,71 @@ class Game:
                     self.sounds.play("die")
 
             # Render game
-            self.screen.blit(self.background, (0, 0))
-            
+            if self.state == "WELCOME" and self._welcome_prev_bird is not None:
+                # Attract screen: only the bird and the base scroll change.
+                # Restore the composited backdrop under last frame's bird,
+                # redraw the moving pieces and push just those regions.
+                prev = self._welcome_prev_bird
+                self.screen.blit(self._welcome_static, prev, prev)
+                bx = int(self.base_x)
+                self.screen.blit(self.base, (bx, self.base_y))
+                if bx + self.base.get_width() < self.screen_width:
+                    self.screen.blit(self.base, (bx + self.base.get_width(), self.base_y))
+                bird_rect = self.bird.draw(self.screen)
+                # Keep the message layered above the bird, as in a full draw
+                self.screen.blit(self.sprites.message, self._msg_topleft)
+                base_rect = pygame.Rect(0, self.base_y, self.screen_width, self.base.get_height())
+                pygame.display.update([prev.union(bird_rect), base_rect])
+                self._welcome_prev_bird = bird_rect
+                last_drawn_state = "WELCOME"
+                continue
+
+            if self.state == "PLAYING" and last_drawn_state == "PLAYING":
+                # Steady-state gameplay: erase only where sprites were or
+                # will be, redraw, and push just those regions. If the
+                # moving parts cover most of the screen anyway, a full
+                # composite + flip is cheaper than many small updates.
+                bird_surf, bird_pos = self.bird.blit_args()
+                bird_rect = pygame.Rect(bird_pos, bird_surf.get_size())
+                step = int(self.base_speed * dt) + 1
+                work = self._playing_dirty(bird_rect, step) + self._prev_dirty
+                if sum(r.width * r.height for r in work) * 2 < screen_area:
+                    for r in work:
+                        self.screen.blit(self.background, r, r)
+                    for pipe in self.pipes:
+                        pipe.draw(self.screen)
+                    bx = int(self.base_x)
+                    self.screen.blit(self.base, (bx, self.base_y))
+                    if bx + self.base.get_width() < self.screen_width:
+                        self.screen.blit(self.base, (bx + self.base.get_width(), self.base_y))
+                    self.screen.blit(bird_surf, bird_pos)
+                    self.draw_score(self.screen)
+                    pygame.display.update(work)
+                    # Everything else covers its own previous position
+                    self._prev_dirty = [bird_rect]
+                    continue
+
+            # Collect the whole compositing pass and let blits() loop in C
+            bx = int(self.base_x)
+            blit_list = [(self.background, (0, 0))]
             for pipe in self.pipes:
-                pipe.draw(self.screen)
-            
-            self.screen.blit(self.base, (int(self.base_x), self.base_y))
-            self.screen.blit(self.base, (int(self.base_x) + self.base.get_width(), self.base_y))
-            
-            self.bird.draw(self.screen)
+                blit_list.extend(pipe.blit_args())
+            blit_list.append((self.base, (bx, self.base_y)))
+            # The base is wider than the screen; the second tile only shows
+            # near the wrap point
+            if bx + self.base.get_width() < self.screen_width:
+                blit_list.append((self.base, (bx + self.base.get_width(), self.base_y)))
+            bird_surf, bird_pos = self.bird.blit_args()
+            blit_list.append((bird_surf, bird_pos))
+            self.screen.blits(blit_list, doreturn=False)
+            bird_rect = pygame.Rect(bird_pos, bird_surf.get_size())
 
             if self.state == "WELCOME":
-                msg_rect = self.sprites.message.get_rect(center=(self.screen_width // 2, int(self.screen_height * 0.40)))
-                self.screen.blit(self.sprites.message, msg_rect.topleft)
+                self.screen.blit(self.sprites.message, self._msg_topleft)
+                self._welcome_prev_bird = bird_rect
             elif self.state == "PLAYING":
                 self.draw_score(self.screen)
+                self._prev_dirty = [bird_rect]
             elif self.state == "GAME_OVER":
                 go_rect = self.sprites.gameover.get_rect(center=(self.screen_width // 2, int(self.screen_height * 0.20)))
                 self.screen.blit(self.sprites.gameover, go_rect.topleft)
@@ -494,7 +767,11 @@ class Game:
                 self.draw_high_score(self.screen)
 
             pygame.display.flip()
+            last_drawn_state = self.state
 
+        # A record set mid-run hasn't hit the game-over flush yet
+        if self.high_score > self._saved_high_score:
+            self._save_high_score()
         pygame.quit()
 
 
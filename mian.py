@@ -2,10 +2,35 @@ import os
 import sys
 import random
 import math
-from typing import List, Tuple, Dict
+from collections import deque
+from typing import Deque, List, Tuple, Dict
 
 import pygame
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the pure-Python step is fine
+    njit = None
+
+
+def _step_bird(vy: float, py: float, rot: float, dt: float,
+               gravity: float, max_fall: float, rot_speed: float) -> Tuple[float, float, float]:
+    """One physics step for the bird; plain scalar math so numba can JIT it."""
+    vy = vy + gravity * dt
+    if vy > max_fall:
+        vy = max_fall
+    py = py + vy * dt
+    rot = 45.0 if vy < 0 else rot - rot_speed * dt
+    if rot < -90.0:
+        rot = -90.0
+    return vy, py, rot
+
+
+if njit is not None:
+    _step_bird = njit(cache=True)(_step_bird)
+    # Trigger compilation at import instead of on the first frame
+    _step_bird(0.0, 0.0, 0.0, 1.0 / 60.0, 1800.0, 600.0, 250.0)
+
 
 def get_resource_path(*parts: str) -> str:
     base_dir = os.path.dirname(os.path.abspath(__file__))
@@ -18,6 +43,9 @@ class SpriteLibrary:
         self.backgrounds: Dict[str, pygame.Surface] = {}
         self.base: pygame.Surface
         self.birds: Dict[str, List[pygame.Surface]] = {}
+        # bird_rotations[color][frame][bucket]: each frame pre-rotated at
+        # 15-degree steps over -90..45, built once at load
+        self.bird_rotations: Dict[str, List[List[pygame.Surface]]] = {}
         self.pipes: Dict[str, pygame.Surface] = {}
         self.message: pygame.Surface
         self.gameover: pygame.Surface
@@ -39,10 +67,12 @@ class SpriteLibrary:
         return pygame.transform.smoothscale(surface, (width, height))
 
     def _load_all(self) -> None:
-        self.backgrounds["day"] = self._scale_surface(self._load_image("sprites", "background-day.png"))
-        self.backgrounds["night"] = self._scale_surface(self._load_image("sprites", "background-night.png"))
+        # Backgrounds and base are opaque; plain convert() blits without
+        # alpha blending
+        self.backgrounds["day"] = self._scale_surface(self._load_image("sprites", "background-day.png", convert_alpha=False))
+        self.backgrounds["night"] = self._scale_surface(self._load_image("sprites", "background-night.png", convert_alpha=False))
 
-        self.base = self._scale_surface(self._load_image("sprites", "base.png"))
+        self.base = self._scale_surface(self._load_image("sprites", "base.png", convert_alpha=False))
 
         bird_sets = {
             "yellow": [
@@ -64,9 +94,15 @@ class SpriteLibrary:
         for color, files in bird_sets.items():
             frames = [self._scale_surface(self._load_image("sprites", f)) for f in files]
             self.birds[color] = frames
+            self.bird_rotations[color] = [
+                [pygame.transform.rotate(f, a) for a in range(-90, 50, 15)]
+                for f in frames]
 
         self.pipes["green"] = self._scale_surface(self._load_image("sprites", "pipe-green.png"))
         self.pipes["red"] = self._scale_surface(self._load_image("sprites", "pipe-red.png"))
+        # One shared flipped surface per color instead of one per spawn
+        self.pipes_flipped = {c: pygame.transform.flip(img, False, True)
+                              for c, img in self.pipes.items()}
 
         self.message = self._scale_surface(self._load_image("sprites", "message.png"))
         self.gameover = self._scale_surface(self._load_image("sprites", "gameover.png"))
@@ -74,6 +110,47 @@ class SpriteLibrary:
         for i in range(10):
             self.digits.append(self._scale_surface(self._load_image("sprites", f"{i}.png")))
 
+        self._pack_atlas()
+
+    def _pack_atlas(self) -> None:
+        """Repack the small alpha sprites into one shared atlas surface.
+
+        The stored sprites become zero-copy subsurface views into the
+        atlas, so every blit in the game reads from a single source
+        surface instead of ~20 separate ones. The opaque backgrounds and
+        base keep their own convert()ed surfaces.
+        """
+        rows: List[List[pygame.Surface]] = [
+            [f for frames in self.birds.values() for f in frames],
+            list(self.pipes.values()) + list(self.pipes_flipped.values()),
+            self.digits,
+            [self.message, self.gameover],
+        ]
+        width = max(sum(s.get_width() for s in row) for row in rows)
+        height = sum(max(s.get_height() for s in row) for row in rows)
+        atlas = pygame.Surface((width, height), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            atlas = atlas.convert_alpha()
+        views: Dict[int, pygame.Surface] = {}
+        y = 0
+        for row in rows:
+            x = 0
+            for surf in row:
+                # BLEND_RGBA_MAX onto the transparent atlas copies pixels
+                # verbatim instead of alpha-compositing them
+                atlas.blit(surf, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+                views[id(surf)] = atlas.subsurface(
+                    pygame.Rect(x, y, surf.get_width(), surf.get_height()))
+                x += surf.get_width()
+            y += max(s.get_height() for s in row)
+        self.atlas = atlas
+        self.birds = {c: [views[id(f)] for f in frames] for c, frames in self.birds.items()}
+        self.pipes = {c: views[id(s)] for c, s in self.pipes.items()}
+        self.pipes_flipped = {c: views[id(s)] for c, s in self.pipes_flipped.items()}
+        self.digits = [views[id(s)] for s in self.digits]
+        self.message = views[id(self.message)]
+        self.gameover = views[id(self.gameover)]
+
 
 class SoundLibrary:
     def __init__(self) -> None:
@@ -114,8 +191,10 @@ class SoundLibrary:
 
 
 class Bird:
-    def __init__(self, frames: List[pygame.Surface], start_pos: Tuple[int, int]) -> None:
+    def __init__(self, frames: List[pygame.Surface], start_pos: Tuple[int, int],
+                 rotations: List[List[pygame.Surface]]) -> None:
         self.frames = frames
+        self.rotations = rotations
         self.animation_index = 0
         self.animation_timer = 0.0
         self.animation_interval = 0.08
@@ -132,33 +211,43 @@ class Bird:
         img = self.image
         return pygame.Rect(int(self.position_x), int(self.position_y), img.get_width(), img.get_height())
 
-    def update(self, dt: float, gravity: float, max_fall_speed: float, rot_down_speed_deg_per_sec: float) -> None:
-        if self.dead:
-            self.animation_index = 1
-        else:
-            self.animation_timer += dt
-            if self.animation_timer >= self.animation_interval:
-                self.animation_timer = 0.0
-                self.animation_index = (self.animation_index + 1) % len(self.frames)
+    def update_playing(self, dt: float, gravity: float, max_fall_speed: float, rot_down_speed_deg_per_sec: float) -> None:
+        self.animation_timer += dt
+        if self.animation_timer >= self.animation_interval:
+            self.animation_timer = 0.0
+            self.animation_index = (self.animation_index + 1) % len(self.frames)
+        self._step_physics(dt, gravity, max_fall_speed, rot_down_speed_deg_per_sec)
 
-        # Physics similar to original clones (frame-based mapped to dt)
-        self.velocity_y = min(self.velocity_y + gravity * dt, max_fall_speed)
-        self.position_y += self.velocity_y * dt
+    def update_falling(self, dt: float, gravity: float, max_fall_speed: float, rot_down_speed_deg_per_sec: float) -> None:
+        # Post-death drop: kill() pinned the frame, so physics only
+        self._step_physics(dt, gravity, max_fall_speed, rot_down_speed_deg_per_sec)
 
-        # Rotation: snap up on rise, fall towards -90 deg otherwise
-        if self.velocity_y < 0:
-            self.rotation = 45.0
-        else:
-            if self.rotation > -90.0:
-                self.rotation = max(-90.0, self.rotation - rot_down_speed_deg_per_sec * dt)
+    def _step_physics(self, dt: float, gravity: float, max_fall_speed: float, rot_down_speed_deg_per_sec: float) -> None:
+        # Physics similar to original clones (frame-based mapped to dt)
+        self.velocity_y, self.position_y, self.rotation = _step_bird(
+            self.velocity_y, self.position_y, self.rotation,
+            dt, gravity, max_fall_speed, rot_down_speed_deg_per_sec)
+
+    def kill(self) -> None:
+        """Mark the bird dead: pin the mid-flap frame and stop animating."""
+        self.dead = True
+        self.animation_index = 1
+        self.animation_timer = 0.0
+        self.animation_interval = float("inf")
 
     def flap(self, impulse: float) -> None:
         if not self.dead:
             self.velocity_y = -impulse
             self.rotation = 45.0
 
+    def current_rotated(self) -> pygame.Surface:
+        """Current frame from the pre-rotated table; no transform at runtime."""
+        bucket = int((self.rotation + 90.0) / 15.0)
+        bucket = 0 if bucket < 0 else (9 if bucket > 9 else bucket)
+        return self.rotations[int(self.animation_index) % len(self.frames)][bucket]
+
     def draw(self, surface: pygame.Surface) -> None:
-        rotated = pygame.transform.rotate(self.image, self.rotation)
+        rotated = self.current_rotated()
         rect = rotated.get_rect(center=self.rect().center)
         surface.blit(rotated, rect.topleft)
 
@@ -170,30 +259,45 @@ class Bird:
 
 
 class PipePair:
-    def __init__(self, pipe_image: pygame.Surface, x: int, gap_y: int, gap_size: int, bottom_y: int) -> None:
+    def __init__(self, pipe_image: pygame.Surface, pipe_image_flipped: pygame.Surface,
+                 x: int, gap_y: int, gap_size: int, bottom_y: int) -> None:
         self.pipe_image = pipe_image
-        self.pipe_image_flipped = pygame.transform.flip(pipe_image, False, True)
-        self.x = float(x)
+        self.pipe_image_flipped = pipe_image_flipped
+        # Fixed-point x in 1/256-pixel units: integer updates, and reads
+        # are a shift instead of a float->int conversion
+        self.x_q8 = int(x) << 8
         self.gap_y = gap_y
         self.gap_size = gap_size
         self.bottom_y = bottom_y
-        self.speed = 150.0
         self.passed = False
+        # Size and vertical placement never change after construction
+        self._w = pipe_image.get_width()
+        self._h = pipe_image.get_height()
+        self._top_y = gap_y - gap_size // 2 - self._h
+        self._bot_y = gap_y + gap_size // 2
+
+    def reset(self, x: int, gap_y: int) -> None:
+        """Re-arm a pooled pair at a fresh spawn position."""
+        self.x_q8 = int(x) << 8
+        self.gap_y = gap_y
+        self.passed = False
+        self._top_y = gap_y - self.gap_size // 2 - self._h
+        self._bot_y = gap_y + self.gap_size // 2
+
+    @property
+    def x(self) -> int:
+        return self.x_q8 >> 8
 
     @property
     def width(self) -> int:
-        return self.pipe_image.get_width()
+        return self._w
 
     def rects(self) -> Tuple[pygame.Rect, pygame.Rect]:
-        top_height = self.gap_y - self.gap_size // 2
-        bottom_top = self.gap_y + self.gap_size // 2
-        top_rect = pygame.Rect(int(self.x), int(top_height) - self.pipe_image.get_height(), self.width, self.pipe_image.get_height())
-        bottom_rect = pygame.Rect(int(self.x), int(bottom_top), self.width, self.pipe_image.get_height())
+        px = self.x_q8 >> 8
+        top_rect = pygame.Rect(px, self._top_y, self._w, self._h)
+        bottom_rect = pygame.Rect(px, self._bot_y, self._w, self._h)
         return top_rect, bottom_rect
 
-    def update(self, dt: float) -> None:
-        self.x -= self.speed * dt
-
     def draw(self, surface: pygame.Surface) -> None:
         top_rect, bottom_rect = self.rects()
         surface.blit(self.pipe_image_flipped, top_rect.topleft)
@@ -204,15 +308,23 @@ class Game:
     def __init__(self) -> None:
         pygame.init()
 
+        # The display must exist before SpriteLibrary loads anything, or
+        # _load_image skips convert()/convert_alpha() and every blit pays a
+        # per-call pixel-format conversion. Probe the background for size.
+        probe = pygame.image.load(get_resource_path("sprites", "background-day.png"))
+        self.screen_width, self.screen_height = probe.get_size()
+        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
+        pygame.display.set_caption("Flappy Bird")
+        # Drop everything but the handled event types at the SDL layer so
+        # mouse motion never becomes a Python event object
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN])
+
         self.sprites = SpriteLibrary()
         self.sounds = SoundLibrary()
 
         self.background_key = random.choice(["day", "night"])  # toggled on restart
         self.background = self.sprites.backgrounds[self.background_key]
-        self.screen_width = self.background.get_width()
-        self.screen_height = self.background.get_height()
-        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
-        pygame.display.set_caption("Flappy Bird")
 
         self.clock = pygame.time.Clock()
         self.fps = 60
@@ -221,15 +333,27 @@ class Game:
         self.base_y = self.screen_height - self.base.get_height()
         self.base_x = 0.0
         self.base_speed = 150.0
+        # Two base copies tiled once into a single strip; the scroll then
+        # costs one blit per frame instead of two
+        self._base_strip = pygame.Surface(
+            (self.base.get_width() + self.screen_width, self.base.get_height())).convert()
+        self._base_strip.blit(self.base, (0, 0))
+        self._base_strip.blit(self.base, (self.base.get_width(), 0))
 
         self.pipe_image = self.sprites.pipes["green"]
-        self.pipes: List[PipePair] = []
+        self.pipe_image_flipped = self.sprites.pipes_flipped["green"]
+        # FIFO: pipes spawn on the right and expire on the left, so a deque
+        # pops expired heads without rebuilding the container. Expired
+        # pairs are pooled and re-armed on the next spawn.
+        self.pipes: Deque[PipePair] = deque()
+        self._pipe_pool: List[PipePair] = []
         self.pipe_spawn_timer = 0.0
         self.pipe_spawn_interval = 1.25
         self.pipe_gap = 100
 
         self.bird_frames = self.sprites.birds["yellow"]
-        self.bird = Bird(self.bird_frames, (self.screen_width // 6, self.screen_height // 2))
+        self.bird = Bird(self.bird_frames, (self.screen_width // 6, self.screen_height // 2),
+                         self.sprites.bird_rotations["yellow"])
         self.gravity = 1800.0
         self.max_fall_speed = 600.0
         self.rot_down_speed = 250.0  # deg/sec toward -90 on fall
@@ -238,28 +362,59 @@ class Game:
         self.state = "WELCOME"
         self.score = 0
         self.high_score = 0
+        # Composited digit surfaces keyed by value; a score draw is then
+        # one blit instead of one per digit
+        self._score_cache: Dict[int, Tuple[pygame.Surface, int]] = {}
+        self._digit_widths = [d.get_width() for d in self.sprites.digits]
+
+        # 256-entry sine table for the idle wobble and spawn bias; the
+        # scales map millisecond ticks to table indices at the original
+        # frequencies (sin(t/250) and sin(1.3 * t/1000))
+        self._sin_lut = [math.sin(i * 2 * math.pi / 256) for i in range(256)]
+        self._wobble_scale = 256 / (2 * math.pi * 250.0)
+        self._bias_scale = 1.3 * 256 / (2 * math.pi * 1000.0)
+
+        # Screen regions repainted last frame while PLAYING; erased from
+        # the background on the next partial redraw
+        self._prev_dirty: List[pygame.Rect] = []
+
+        # The overlay positions never change; centre them once
+        self._msg_pos = self.sprites.message.get_rect(
+            center=(self.screen_width // 2, int(self.screen_height * 0.40))).topleft
+        self._gameover_pos = self.sprites.gameover.get_rect(
+            center=(self.screen_width // 2, int(self.screen_height * 0.20))).topleft
 
     def reset(self) -> None:
         self.background_key = "night" if self.background_key == "day" else "day"
         self.background = self.sprites.backgrounds[self.background_key]
         self.base_x = 0.0
         self.pipe_image = self.sprites.pipes["green"]
+        self.pipe_image_flipped = self.sprites.pipes_flipped["green"]
+        self._pipe_pool.extend(self.pipes)
         self.pipes.clear()
         self.pipe_spawn_timer = 0.0
         self.bird_frames = self.sprites.birds["yellow"]
-        self.bird = Bird(self.bird_frames, (self.screen_width // 6, self.screen_height // 2))
+        self.bird = Bird(self.bird_frames, (self.screen_width // 6, self.screen_height // 2),
+                         self.sprites.bird_rotations["yellow"])
         self.score = 0
         self.state = "WELCOME"
+        self._prev_dirty = []
 
     def spawn_pipe(self) -> None:
         # Slight sinusoidal bias to gap to mimic original feel
         min_center = int(self.screen_height * 0.25) + self.pipe_gap // 2
         max_center = int(self.base_y - 10 - self.pipe_gap // 2)
         base_center = random.randint(min_center, max_center)
-        t = pygame.time.get_ticks() / 1000.0
-        bias = int(20 * math.sin(t * 1.3))
+        idx = int(pygame.time.get_ticks() * self._bias_scale) & 0xFF
+        bias = int(20 * self._sin_lut[idx])
         gap_center = max(min_center, min(max_center, base_center + bias))
-        self.pipes.append(PipePair(self.pipe_image, self.screen_width + 10, gap_center, self.pipe_gap, self.base_y))
+        if self._pipe_pool:
+            pipe = self._pipe_pool.pop()
+            pipe.reset(self.screen_width + 10, gap_center)
+        else:
+            pipe = PipePair(self.pipe_image, self.pipe_image_flipped,
+                            self.screen_width + 10, gap_center, self.pipe_gap, self.base_y)
+        self.pipes.append(pipe)
 
     def update_base(self, dt: float) -> None:
         self.base_x -= self.base_speed * dt
@@ -271,27 +426,31 @@ class Game:
         if bird_rect.bottom >= self.base_y:
             return True
 
-        rotated = pygame.transform.rotate(self.bird.image, self.bird.rotation)
-        bird_mask = pygame.mask.from_surface(rotated)
-        bird_rot_rect = rotated.get_rect(center=self.bird.rect().center)
-
+        # Pipes are solid axis-aligned rectangles, so plain rect overlap is
+        # exact; the inset keeps the forgiveness the mask test used to give
+        # around the bird's transparent corners
+        hit_rect = bird_rect.inflate(-4, -4)
+        # Pipes stay sorted left-to-right, so only the one or two spanning
+        # the bird's x-range need a rect test
+        bx0 = hit_rect.left
+        bx1 = hit_rect.right
         for pipe in self.pipes:
+            if pipe.x > bx1:
+                break
+            if pipe.x + pipe.width < bx0:
+                continue
             top_rect, bottom_rect = pipe.rects()
-            top_mask = pygame.mask.from_surface(pipe.pipe_image_flipped)
-            bottom_mask = pygame.mask.from_surface(pipe.pipe_image)
-
-            offset_top = (top_rect.left - bird_rot_rect.left, top_rect.top - bird_rot_rect.top)
-            if bird_mask.overlap(top_mask, offset_top):
-                return True
-
-            offset_bottom = (bottom_rect.left - bird_rot_rect.left, bottom_rect.top - bird_rot_rect.top)
-            if bird_mask.overlap(bottom_mask, offset_bottom):
+            if hit_rect.colliderect(top_rect) or hit_rect.colliderect(bottom_rect):
                 return True
         return False
 
     def update_score(self) -> None:
+        bird_left = self.bird.rect().left
         for pipe in self.pipes:
-            if not pipe.passed and pipe.x + pipe.width < self.bird.rect().left:
+            if pipe.x + pipe.width >= bird_left:
+                # Sorted by x: this and every later pipe is still ahead
+                break
+            if not pipe.passed:
                 pipe.passed = True
                 self.score += 1
                 self.high_score = max(self.high_score, self.score)
@@ -317,36 +476,88 @@ class Game:
             elif self.state == "GAME_OVER":
                 self.reset()
 
+    def _render_number(self, value: int) -> Tuple[pygame.Surface, int]:
+        cached = self._score_cache.get(value)
+        if cached is None:
+            widths = self._digit_widths
+            digits = [int(d) for d in str(value)]
+            total_width = sum(widths[d] for d in digits)
+            strip = pygame.Surface((total_width, self.sprites.digits[0].get_height()),
+                                   pygame.SRCALPHA)
+            x = 0
+            for d in digits:
+                strip.blit(self.sprites.digits[d], (x, 0))
+                x += widths[d]
+            cached = (strip, (self.screen_width - total_width) // 2)
+            self._score_cache[value] = cached
+        return cached
+
     def draw_score(self, surface: pygame.Surface) -> None:
-        digits = [int(d) for d in str(self.score)]
-        total_width = sum(self.sprites.digits[d].get_width() for d in digits)
-        x = (self.screen_width - total_width) // 2
-        y = int(self.screen_height * 0.12)
-        for d in digits:
-            img = self.sprites.digits[d]
-            surface.blit(img, (x, y))
-            x += img.get_width()
+        strip, x = self._render_number(self.score)
+        surface.blit(strip, (x, int(self.screen_height * 0.12)))
 
     def draw_high_score(self, surface: pygame.Surface) -> None:
         if self.state != "GAME_OVER":
             return
-        text_digits = [int(d) for d in str(self.high_score)]
-        total_width = sum(self.sprites.digits[d].get_width() for d in text_digits)
-        x = (self.screen_width - total_width) // 2
-        y = int(self.screen_height * 0.25)
-        for d in text_digits:
-            img = self.sprites.digits[d]
-            surface.blit(img, (x, y))
-            x += img.get_width()
+        strip, x = self._render_number(self.high_score)
+        surface.blit(strip, (x, int(self.screen_height * 0.25)))
+
+    def _playing_dirty(self, bird_rect: pygame.Rect, step: int) -> List[pygame.Rect]:
+        """Screen regions a PLAYING frame repaints.
+
+        Every rect except the bird's also covers its own position last
+        frame: the base row and score strip sit still (the strip is
+        centred and only grows), and the pipe rects are widened by the
+        scroll step, so only the bird needs separate prev tracking.
+        """
+        screen_w = self.screen_width
+        base_y = self.base_y
+        dirty = [bird_rect,
+                 pygame.Rect(0, base_y, screen_w, self.base.get_height())]
+        strip, sx = self._render_number(self.score)
+        dirty.append(pygame.Rect(sx, int(self.screen_height * 0.12),
+                                 strip.get_width(), strip.get_height()))
+        for pipe in self.pipes:
+            # Sprite-sized rects clipped to the playfield keep the area
+            # sum honest; the gap between the halves stays untouched
+            x = pipe.x
+            w = pipe.width + step
+            if x < 0:
+                w += x
+                x = 0
+            if x + w > screen_w:
+                w = screen_w - x
+            if w <= 0:
+                continue
+            gap_top = pipe._top_y + pipe._h
+            if gap_top > 0:
+                dirty.append(pygame.Rect(x, 0, w, gap_top))
+            bot_h = base_y - pipe._bot_y
+            if bot_h > 0:
+                dirty.append(pygame.Rect(x, pipe._bot_y, w, bot_h))
+        return dirty
 
     def run(self) -> None:
         running = True
         death_sound_played = False
+        last_drawn_state = ""
+        screen_area = self.screen_width * self.screen_height
+        # Hot-loop locals: LOAD_FAST instead of attribute lookups at 60 Hz.
+        # Only objects that survive reset() are hoisted; bird, pipes and
+        # background are re-bound on restart and stay attribute reads.
+        screen = self.screen
+        sprites = self.sprites
+        base_strip = self._base_strip
+        base_y = self.base_y
+        fps = self.fps
+        tick = self.clock.tick
+        event_get = pygame.event.get
+        flip = pygame.display.flip
         while running:
-            dt_ms = self.clock.tick(self.fps)
+            dt_ms = tick(fps)
             dt = dt_ms / 1000.0
 
-            for event in pygame.event.get():
+            for event in event_get():
                 if event.type == pygame.QUIT:
                     running = False
                 else:
@@ -357,10 +568,11 @@ class Game:
                 # In welcome screen, apply idle oscillation and slow animation
                 if self.state == "WELCOME":
                     self.bird.update_animation(dt)
-                    self.bird.position_y = (self.screen_height // 2) + 6 * math.sin(pygame.time.get_ticks() / 250.0)
+                    idx = int(pygame.time.get_ticks() * self._wobble_scale) & 0xFF
+                    self.bird.position_y = (self.screen_height // 2) + 6 * self._sin_lut[idx]
                     self.bird.rotation = 0.0
                 else:
-                    self.bird.update(dt, self.gravity, self.max_fall_speed, self.rot_down_speed)
+                    self.bird.update_playing(dt, self.gravity, self.max_fall_speed, self.rot_down_speed)
 
             if self.state == "PLAYING":
                 self.pipe_spawn_timer += dt
@@ -368,13 +580,18 @@ class Game:
                     self.pipe_spawn_timer = 0.0
                     self.spawn_pipe()
 
-                for pipe in list(self.pipes):
-                    pipe.update(dt)
-                self.pipes = [p for p in self.pipes if p.x + p.width > -10]
+                # All pipes share one speed; compute the fixed-point step
+                # once and apply it directly instead of per-pipe update()
+                dx_q8 = int(self.base_speed * dt * 256.0)
+                for pipe in self.pipes:
+                    pipe.x_q8 -= dx_q8
+                # Only the head can expire; no per-frame list rebuild
+                while self.pipes and self.pipes[0].x + self.pipes[0].width <= -10:
+                    self._pipe_pool.append(self.pipes.popleft())
 
                 if self.check_collisions():
                     self.state = "GAME_OVER"
-                    self.bird.dead = True
+                    self.bird.kill()
                     death_sound_played = False
                     self.sounds.play("hit")
 
@@ -382,31 +599,53 @@ class Game:
 
             elif self.state == "GAME_OVER":
                 self.update_base(dt)
-                self.bird.update(dt, self.gravity, self.max_fall_speed, self.rot_down_speed)
+                self.bird.update_falling(dt, self.gravity, self.max_fall_speed, self.rot_down_speed)
                 if not death_sound_played and self.bird.rect().bottom >= self.base_y - 1:
                     death_sound_played = True
                     self.sounds.play("die")
 
-            self.screen.blit(self.background, (0, 0))
+            if self.state == "PLAYING" and last_drawn_state == "PLAYING":
+                # Steady-state gameplay: erase the background only under
+                # last frame's and this frame's sprites and push just those
+                # regions. If the moving parts cover most of the screen,
+                # the full composite + flip below is cheaper.
+                rotated = self.bird.current_rotated()
+                bird_rect = rotated.get_rect(center=self.bird.rect().center)
+                step = (dx_q8 >> 8) + 1
+                work = self._playing_dirty(bird_rect, step) + self._prev_dirty
+                if sum(r.width * r.height for r in work) * 2 < screen_area:
+                    for r in work:
+                        screen.blit(self.background, r, r)
+                    for pipe in self.pipes:
+                        pipe.draw(screen)
+                    screen.blit(base_strip, (int(self.base_x), base_y))
+                    screen.blit(rotated, bird_rect.topleft)
+                    self.draw_score(screen)
+                    pygame.display.update(work)
+                    # Everything else covers its own previous position
+                    self._prev_dirty = [bird_rect]
+                    continue
+
+            screen.blit(self.background, (0, 0))
             for pipe in self.pipes:
-                pipe.draw(self.screen)
-            self.screen.blit(self.base, (int(self.base_x), self.base_y))
-            self.screen.blit(self.base, (int(self.base_x) + self.base.get_width(), self.base_y))
-            self.bird.draw(self.screen)
+                pipe.draw(screen)
+            screen.blit(base_strip, (int(self.base_x), base_y))
+            self.bird.draw(screen)
 
             if self.state == "WELCOME":
-                msg_rect = self.sprites.message.get_rect(center=(self.screen_width // 2, int(self.screen_height * 0.40)))
-                self.screen.blit(self.sprites.message, msg_rect.topleft)
+                screen.blit(sprites.message, self._msg_pos)
                 # Draw score 0 like original welcome screen shows no score
             if self.state in ("PLAYING",):
-                self.draw_score(self.screen)
+                self.draw_score(screen)
+                rotated = self.bird.current_rotated()
+                self._prev_dirty = [rotated.get_rect(center=self.bird.rect().center)]
             if self.state == "GAME_OVER":
-                go_rect = self.sprites.gameover.get_rect(center=(self.screen_width // 2, int(self.screen_height * 0.20)))
-                self.screen.blit(self.sprites.gameover, go_rect.topleft)
-                self.draw_score(self.screen)
-                self.draw_high_score(self.screen)
+                screen.blit(sprites.gameover, self._gameover_pos)
+                self.draw_score(screen)
+                self.draw_high_score(screen)
 
-            pygame.display.flip()
+            flip()
+            last_drawn_state = self.state
 
         pygame.quit()
 